@@ -6,16 +6,19 @@ Flask API server for the fog computing simulation platform.
 Implements priority-based task scheduling and routing.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import json
 import os
 import threading
 import time
-import queue
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from statistics import fmean
 import random
 import heapq
+import tempfile
 
 app = Flask(__name__)
 
@@ -65,46 +68,124 @@ PRIORITY_WEIGHTS = {
     'LOW': 1
 }
 
+# Number of most recent task latencies averaged into the latency history
+LATENCY_WINDOW = 10
+
+# Each fog node rolls for a failure with `failure_probability` once per interval (seconds)
+FAILURE_CHECK_INTERVAL = 2.0
+
+# Seconds between progress events emitted by the simulation loop
+PROGRESS_REPORT_INTERVAL = 3.0
+
+# IoT devices shown in the topology view (static, built once at import)
+TOPOLOGY_IOT_DEVICES = [
+    {'id': 'IOT_001', 'x': 10, 'y': 10, 'connected_to': 'FOG_001'},
+    {'id': 'IOT_002', 'x': 30, 'y': 15, 'connected_to': 'FOG_001'},
+    {'id': 'IOT_003', 'x': 70, 'y': 15, 'connected_to': 'FOG_002'},
+    {'id': 'IOT_004', 'x': 90, 'y': 25, 'connected_to': 'FOG_002'},
+    {'id': 'IOT_005', 'x': 40, 'y': 70, 'connected_to': 'FOG_003'},
+    {'id': 'IOT_006', 'x': 60, 'y': 90, 'connected_to': 'FOG_003'}
+]
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
+
+def save_config_to_file(config):
+    """
+    Write configuration to config.json atomically.
+    The JSON is written to a unique temp file in the same directory and moved
+    over config.json with os.replace, so a crash mid-write never leaves a
+    truncated config behind and concurrent writers never share a temp file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CONFIG_PATH), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f, indent=2)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates the file owner-only
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def default_device_priorities(num_devices, first_device=1):
+    """
+    Default priority per device: first 30% HIGH, next 40% MODERATE, rest LOW.
+    The cut-off indexes are computed once instead of per device.
+    
+    Returns:
+        dict: device_id -> priority for device_{first_device}..device_{num_devices}
+    """
+    high_cutoff = int(num_devices * 0.3)
+    moderate_cutoff = int(num_devices * 0.7)
+    return {
+        f'device_{i}': 'HIGH' if i <= high_cutoff else 'MODERATE' if i <= moderate_cutoff else 'LOW'
+        for i in range(first_device, num_devices + 1)
+    }
+
+def parse_bool(value, default):
+    """
+    Interpret a config flag as a boolean.
+    Accepts real booleans, 0/1 style numbers and "true"/"false"/"yes"/"no"/
+    "on"/"off"/"1"/"0" strings (case-insensitive); anything else is default.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in ('true', 'yes', 'on', '1'):
+            return True
+        if normalized in ('false', 'no', 'off', '0'):
+            return False
+    return default
+
 def load_config_from_file():
     """Load configuration from config.json if it exists."""
-    config_path = os.path.join(os.path.dirname(__file__), 'config.json')
     try:
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
+        if os.path.exists(CONFIG_PATH):
+            with open(CONFIG_PATH, 'r') as f:
                 config = json.load(f)
-                
-                # Validate and fix config values
-                if 'network' not in config:
-                    config['network'] = {}
-                
-                # Ensure fog_nodes is valid
-                fog_nodes = config['network'].get('fog_nodes', 3)
-                if not isinstance(fog_nodes, int) or fog_nodes < 1:
-                    fog_nodes = 3
-                config['network']['fog_nodes'] = fog_nodes
-                
-                # Ensure iot_devices is valid (never null)
-                iot_devices = config['network'].get('iot_devices', 10)
-                if iot_devices is None or not isinstance(iot_devices, int) or iot_devices < 1:
-                    iot_devices = 10
-                config['network']['iot_devices'] = iot_devices
-                
-                # Validate other sections
-                if 'simulation' not in config:
-                    config['simulation'] = {'duration': 100, 'enable_failures': True, 'failure_probability': 0.1}
-                if 'tasks' not in config:
-                    config['tasks'] = {'rate_range': [0.1, 0.3], 'complexity_range': [50, 2000]}
-                if 'latency' not in config:
-                    config['latency'] = {'base_latency': 0.01, 'cloud_latency': 5.0}
-                if 'offloading' not in config:
-                    config['offloading'] = {'complexity_threshold': 1000, 'utilization_threshold': 0.8}
-                
-                # Save corrected config back to file
-                with open(config_path, 'w') as f:
-                    json.dump(config, f, indent=2)
-                
-                print(f"✅ Configuration loaded and validated from config.json")
-                return config
+            
+            # Validate and fix config values
+            if 'network' not in config:
+                config['network'] = {}
+            
+            # Ensure fog_nodes is valid
+            fog_nodes = config['network'].get('fog_nodes', 3)
+            if not isinstance(fog_nodes, int) or fog_nodes < 1:
+                fog_nodes = 3
+            config['network']['fog_nodes'] = fog_nodes
+            
+            # Ensure iot_devices is valid (never null)
+            iot_devices = config['network'].get('iot_devices', 10)
+            if iot_devices is None or not isinstance(iot_devices, int) or iot_devices < 1:
+                iot_devices = 10
+            config['network']['iot_devices'] = iot_devices
+            
+            # Validate other sections
+            if 'simulation' not in config:
+                config['simulation'] = {'duration': 100, 'enable_failures': True, 'failure_probability': 0.1, 'log_task_events': True}
+            
+            # Ensure log_task_events is a real boolean (logging stays on by default)
+            if isinstance(config['simulation'], dict):
+                config['simulation']['log_task_events'] = parse_bool(
+                    config['simulation'].get('log_task_events', True), True)
+            
+            if 'tasks' not in config:
+                config['tasks'] = {'rate_range': [0.1, 0.3], 'complexity_range': [50, 2000]}
+            if 'latency' not in config:
+                config['latency'] = {'base_latency': 0.01, 'cloud_latency': 5.0}
+            if 'offloading' not in config:
+                config['offloading'] = {'complexity_threshold': 1000, 'utilization_threshold': 0.8}
+            
+            # Save corrected config back to file
+            save_config_to_file(config)
+            
+            print(f"✅ Configuration loaded and validated from config.json")
+            return config
     except Exception as e:
         print(f"⚠️ Error loading config: {e}")
     
@@ -113,7 +194,8 @@ def load_config_from_file():
         'simulation': {
             'duration': 100,
             'enable_failures': True,
-            'failure_probability': 0.1
+            'failure_probability': 0.1,
+            'log_task_events': True
         },
         'network': {
             'fog_nodes': 3,
@@ -135,8 +217,7 @@ def load_config_from_file():
     
     # Save default config to file
     try:
-        with open(config_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        save_config_to_file(default_config)
     except:
         pass
     
@@ -164,10 +245,13 @@ simulation_state = {
     },
     # Priority-based task queues
     'pending_fog_tasks': [],  # Priority queue (heap)
-    'cloud_tasks': [],  # Regular list
+    'cloud_tasks': deque(),  # FIFO queue
     'active_tasks': {},  # Track active tasks by task_id
+    'active_counts': {'fog': 0, 'cloud': 0},  # Running count of active tasks per tier
+    'active_deadlines': [],  # Min-heap of (completion_time, task_id) for active tasks
     'task_counter': 0,  # Global task ID counter
     'priority_distribution': {'HIGH': 0, 'MODERATE': 0, 'LOW': 0},
+    'node_failures': [],  # Failure count per fog node (index = node_id - 1)
     # Device priority mapping: device_id -> priority
     'device_priorities': {}  # Will be initialized from config
 }
@@ -183,63 +267,73 @@ if num_devices is None or not isinstance(num_devices, int) or num_devices < 1:
         simulation_state['config']['network'] = {}
     simulation_state['config']['network']['iot_devices'] = num_devices
 
-simulation_state['device_priorities'] = {}
-for i in range(1, num_devices + 1):
-    device_id = f'device_{i}'
-    # Default: distribute priorities (30% HIGH, 40% MODERATE, 30% LOW)
-    if i <= num_devices * 0.3:
-        simulation_state['device_priorities'][device_id] = 'HIGH'
-    elif i <= num_devices * 0.7:
-        simulation_state['device_priorities'][device_id] = 'MODERATE'
-    else:
-        simulation_state['device_priorities'][device_id] = 'LOW'
+# Default: distribute priorities (30% HIGH, 40% MODERATE, 30% LOW)
+simulation_state['device_priorities'] = default_device_priorities(num_devices)
 
 print(f"🚀 Server started with {simulation_state['config']['network']['fog_nodes']} fog nodes")
 print(f"📱 Device priorities initialized for {num_devices} devices")
 
-# Event queue for real-time updates
-event_queue = queue.Queue()
+# Event buffer for real-time updates
+# Bounded ring: the frontend only shows the latest events, so when nobody
+# polls /api/simulation/events the oldest entries are dropped instead of
+# accumulating for the whole run. deque append/popleft are thread-safe.
+EVENT_BUFFER_SIZE = 500
+event_queue = deque(maxlen=EVENT_BUFFER_SIZE)
 
 # Lock for thread-safe operations
 state_lock = threading.Lock()
 
-def generate_task(current_time):
+def push_event(event_type, message):
+    """Append a timestamped event to the real-time event buffer."""
+    event_queue.append({
+        'type': event_type,
+        'message': message,
+        'timestamp': datetime.now().isoformat()
+    })
+
+def push_events(event_type, messages):
+    """Append several events sharing one timestamp to the event buffer in one call."""
+    timestamp = datetime.now().isoformat()
+    event_queue.extend([
+        {'type': event_type, 'message': message, 'timestamp': timestamp}
+        for message in messages
+    ])
+
+def generate_task(current_time, device_ids, complexity_range):
     """
     Generate a new IoT task with priority, complexity, and arrival time.
     Priority is determined by the device that generates the task.
     
+    Args:
+        current_time: Elapsed simulation time used as the arrival time
+        device_ids: Tuple of IoT device ids that may generate the task
+        complexity_range: [min, max] task complexity
+    
     Returns:
         dict: Task with task_id, priority, complexity, arrival_time, node_assigned, device_id
     """
     global simulation_state
     
+    # Select a random device to generate the task
+    device_id = random.choice(device_ids)
+    
+    # Assign the task id and read the device priority under a single lock
     with state_lock:
         simulation_state['task_counter'] += 1
         task_id = simulation_state['task_counter']
+        priority = simulation_state.get('device_priorities', {}).get(device_id)
     
-    # Select a random device to generate the task
-    num_devices = simulation_state.get('config', {}).get('network', {}).get('iot_devices', 10)
-    device_index = random.randint(1, num_devices)
-    device_id = f'device_{device_index}'
-    
-    # Get priority from device configuration (fallback to random if not set)
-    with state_lock:
-        device_priorities = simulation_state.get('device_priorities', {})
-        priority = device_priorities.get(device_id)
-        
-        # If device priority not set, use random (backward compatibility)
-        if not priority:
-            priority_roll = random.random()
-            if priority_roll < 0.3:
-                priority = 'HIGH'
-            elif priority_roll < 0.7:
-                priority = 'MODERATE'
-            else:
-                priority = 'LOW'
+    # If device priority not set, use random (backward compatibility)
+    if not priority:
+        priority_roll = random.random()
+        if priority_roll < 0.3:
+            priority = 'HIGH'
+        elif priority_roll < 0.7:
+            priority = 'MODERATE'
+        else:
+            priority = 'LOW'
     
     # Complexity based on config
-    config = simulation_state.get('config', {})
-    complexity_range = config.get('tasks', {}).get('complexity_range', [50, 2000])
     complexity = random.randint(complexity_range[0], complexity_range[1])
     
     # Determine node assignment based on priority
@@ -259,10 +353,11 @@ def generate_task(current_time):
     
     return task
 
-def schedule_fog_task(task):
+def schedule_fog_task(task, log_events=True):
     """
     Add HIGH priority task to fog priority queue.
     Sorting: (-priority_weight, arrival_time, complexity)
+    Per-task events are skipped when log_events is False.
     """
     global simulation_state
     
@@ -274,21 +369,19 @@ def schedule_fog_task(task):
         heapq.heappush(simulation_state['pending_fog_tasks'], (sort_key, task))
         simulation_state['priority_distribution'][task['priority']] += 1
     
-    event_queue.put({
-        'type': 'info',
-        'message': f"Task {task['task_id']} generated: {task['priority']} (complexity={task['complexity']})",
-        'timestamp': datetime.now().isoformat()
-    })
+    if not log_events:
+        return
     
-    event_queue.put({
-        'type': 'info',
-        'message': f"Task {task['task_id']} assigned to fog",
-        'timestamp': datetime.now().isoformat()
-    })
+    push_events('info', [
+        f"Task {task['task_id']} generated: {task['priority']} (complexity={task['complexity']})",
+        f"Task {task['task_id']} assigned to fog",
+        f"Task {task['task_id']} generated by {task.get('device_id', 'unknown')} with {task['priority']} priority"
+    ])
 
-def schedule_cloud_task(task):
+def schedule_cloud_task(task, log_events=True):
     """
     Add LOW/MODERATE priority task to cloud queue.
+    Per-task events are skipped when log_events is False.
     """
     global simulation_state
     
@@ -296,17 +389,14 @@ def schedule_cloud_task(task):
         simulation_state['cloud_tasks'].append(task)
         simulation_state['priority_distribution'][task['priority']] += 1
     
-    event_queue.put({
-        'type': 'info',
-        'message': f"Task {task['task_id']} generated: {task['priority']} (complexity={task['complexity']})",
-        'timestamp': datetime.now().isoformat()
-    })
+    if not log_events:
+        return
     
-    event_queue.put({
-        'type': 'info',
-        'message': f"Task {task['task_id']} offloaded to cloud",
-        'timestamp': datetime.now().isoformat()
-    })
+    push_events('info', [
+        f"Task {task['task_id']} generated: {task['priority']} (complexity={task['complexity']})",
+        f"Task {task['task_id']} offloaded to cloud",
+        f"Task {task['task_id']} generated by {task.get('device_id', 'unknown')} with {task['priority']} priority"
+    ])
 
 def process_fog_task(current_time):
     """
@@ -322,31 +412,28 @@ def process_fog_task(current_time):
         # Pop highest priority task
         sort_key, task = heapq.heappop(simulation_state['pending_fog_tasks'])
         
+        # Simulate processing time: base latency + complexity factor
+        # Higher complexity = longer processing
+        # Increased processing time to allow queues to build up
+        base_latency = 200  # ms (increased from 30ms)
+        complexity_factor = task['complexity'] / 50  # 1ms to 40ms (increased from /100)
+        processing_latency = base_latency + complexity_factor
+        
         # Mark as active (use actual time, not elapsed)
+        # Processing time is stored in seconds; the completion time is derived
+        # from the same start timestamp and queued for cleanup right away
         task['processing_start'] = time.time()
+        task['processing_time'] = processing_latency / 1000  # Convert ms to seconds
         simulation_state['active_tasks'][task['task_id']] = task
-    
-    # Simulate processing time: base latency + complexity factor
-    # Higher complexity = longer processing
-    # Increased processing time to allow queues to build up
-    base_latency = 200  # ms (increased from 30ms)
-    complexity_factor = task['complexity'] / 50  # 1ms to 40ms (increased from /100)
-    processing_latency = base_latency + complexity_factor
-    
-    # Store processing time in task for cleanup calculation (in seconds)
-    # Make processing time longer so queues can build up
-    task['processing_time'] = processing_latency / 1000  # Convert ms to seconds
-    
-    # Check if there's another task being processed (for scheduling comparison)
-    with state_lock:
+        simulation_state['active_counts']['fog'] += 1
+        heapq.heappush(simulation_state['active_deadlines'],
+                       (task['processing_start'] + task['processing_time'], task['task_id']))
+        
+        # Check if there's another task being processed (for scheduling comparison)
         if simulation_state['pending_fog_tasks']:
             next_sort_key, next_task = simulation_state['pending_fog_tasks'][0]
             if next_task['arrival_time'] < task['arrival_time']:
-                event_queue.put({
-                    'type': 'info',
-                    'message': f"Fog scheduling: Task {task['task_id']} processed before Task {next_task['task_id']} (higher priority)",
-                    'timestamp': datetime.now().isoformat()
-                })
+                push_event('info', f"Fog scheduling: Task {task['task_id']} processed before Task {next_task['task_id']} (higher priority)")
     
     return processing_latency
 
@@ -362,21 +449,53 @@ def process_cloud_task(current_time):
             return None
         
         # Process first task (FIFO)
-        task = simulation_state['cloud_tasks'].pop(0)
+        task = simulation_state['cloud_tasks'].popleft()
+        
+        # Cloud has higher base latency + network overhead
+        # Increased processing time to allow queues to build up
+        base_latency = 500  # ms (increased from 120ms)
+        complexity_factor = task['complexity'] / 40  # 1.25ms to 50ms (increased from /80)
+        processing_latency = base_latency + complexity_factor
+        
+        # Processing time is stored in seconds; the completion time is derived
+        # from the same start timestamp and queued for cleanup right away
         task['processing_start'] = time.time()
+        task['processing_time'] = processing_latency / 1000  # Convert ms to seconds
         simulation_state['active_tasks'][task['task_id']] = task
-    
-    # Cloud has higher base latency + network overhead
-    # Increased processing time to allow queues to build up
-    base_latency = 500  # ms (increased from 120ms)
-    complexity_factor = task['complexity'] / 40  # 1.25ms to 50ms (increased from /80)
-    processing_latency = base_latency + complexity_factor
-    
-    # Store processing time in task for cleanup calculation (in seconds)
-    task['processing_time'] = processing_latency / 1000  # Convert ms to seconds
+        simulation_state['active_counts']['cloud'] += 1
+        heapq.heappush(simulation_state['active_deadlines'],
+                       (task['processing_start'] + task['processing_time'], task['task_id']))
     
     return processing_latency
 
+def count_active_tasks():
+    """
+    Active task count per processing tier.
+    The counts are kept up to date as tasks start and finish, so no scan
+    over active_tasks is needed. Caller must hold state_lock.
+    
+    Returns:
+        tuple: (active_fog, active_cloud)
+    """
+    active_counts = simulation_state['active_counts']
+    return active_counts['fog'], active_counts['cloud']
+
+def build_failure_heap(num_fog_nodes, failure_rate):
+    """
+    Min-heap holding only the next failure time of each fog node.
+    When a node's failure fires, the caller pushes that node's next draw
+    back, so the heap never holds more than num_fog_nodes entries.
+
+    Returns:
+        list: heap of (failure_time, node_id) tuples
+    """
+    if failure_rate <= 0 or num_fog_nodes < 1:
+        return []
+
+    failure_heap = [(random.expovariate(failure_rate), node_id) for node_id in range(1, num_fog_nodes + 1)]
+    heapq.heapify(failure_heap)
+    return failure_heap
+
 @app.route('/api/health')
 def health_check():
     """Simple health check endpoint for connection testing."""
@@ -398,10 +517,7 @@ def get_status():
         
         # Count active tasks (currently being processed)
         # Active tasks are tasks that have been popped from queue but not yet completed
-        active_fog_tasks = sum(1 for task in simulation_state['active_tasks'].values() 
-                              if task.get('node_assigned') == 'fog')
-        active_cloud_tasks = sum(1 for task in simulation_state['active_tasks'].values() 
-                                if task.get('node_assigned') == 'cloud')
+        active_fog_tasks, active_cloud_tasks = count_active_tasks()
         
         # Total queue length = pending + active
         fog_queue_length = fog_pending + active_fog_tasks
@@ -425,7 +541,10 @@ def get_status():
 def get_config():
     """Get current configuration."""
     try:
-        return jsonify(simulation_state.get('config', load_config_from_file()))
+        config = simulation_state.get('config')
+        if config is None:
+            config = load_config_from_file()
+        return jsonify(config)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -444,7 +563,11 @@ def update_config():
         if 'network' not in config_data:
             config_data['network'] = simulation_state.get('config', {}).get('network', {'fog_nodes': 3, 'iot_devices': 10})
         if 'simulation' not in config_data:
-            config_data['simulation'] = simulation_state.get('config', {}).get('simulation', {'duration': 100, 'enable_failures': True, 'failure_probability': 0.1})
+            config_data['simulation'] = simulation_state.get('config', {}).get('simulation', {'duration': 100, 'enable_failures': True, 'failure_probability': 0.1, 'log_task_events': True})
+        # Normalise log_task_events so strings like "false" really disable logging
+        if isinstance(config_data['simulation'], dict):
+            config_data['simulation']['log_task_events'] = parse_bool(
+                config_data['simulation'].get('log_task_events', True), True)
         if 'tasks' not in config_data:
             config_data['tasks'] = simulation_state.get('config', {}).get('tasks', {'rate_range': [0.1, 0.3], 'complexity_range': [50, 2000]})
         if 'latency' not in config_data:
@@ -468,15 +591,8 @@ def update_config():
             
             # If device count increased, add new devices with default priorities
             if num_devices > current_devices:
-                for i in range(current_devices + 1, num_devices + 1):
-                    device_id = f'device_{i}'
-                    # Default priority distribution
-                    if i <= num_devices * 0.3:
-                        simulation_state['device_priorities'][device_id] = 'HIGH'
-                    elif i <= num_devices * 0.7:
-                        simulation_state['device_priorities'][device_id] = 'MODERATE'
-                    else:
-                        simulation_state['device_priorities'][device_id] = 'LOW'
+                simulation_state['device_priorities'].update(
+                    default_device_priorities(num_devices, current_devices + 1))
             # If device count decreased, remove extra devices
             elif num_devices < current_devices:
                 devices_to_remove = [f'device_{i}' for i in range(num_devices + 1, current_devices + 1)]
@@ -485,9 +601,7 @@ def update_config():
         
         # Save configuration to file
         try:
-            config_path = os.path.join(os.path.dirname(__file__), 'config.json')
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            save_config_to_file(config_data)
         except Exception as file_error:
             print(f"⚠️ Warning: Could not save config to file: {file_error}")
             # Continue even if file save fails
@@ -580,8 +694,15 @@ def start_simulation():
             }
             # Reset task queues
             simulation_state['pending_fog_tasks'] = []
-            simulation_state['cloud_tasks'] = []
+            simulation_state['cloud_tasks'] = deque()
             simulation_state['active_tasks'] = {}
+            simulation_state['active_counts'] = {'fog': 0, 'cloud': 0}
+            simulation_state['active_deadlines'] = []
+            # Per-node failure counts, reset with the metrics they break down
+            num_fog_nodes = simulation_state.get('config', {}).get('network', {}).get('fog_nodes', 3)
+            if not isinstance(num_fog_nodes, int) or num_fog_nodes < 1:
+                num_fog_nodes = 3
+            simulation_state['node_failures'] = [0] * num_fog_nodes
             simulation_state['task_counter'] = 0
             simulation_state['priority_distribution'] = {'HIGH': 0, 'MODERATE': 0, 'LOW': 0}
             # Reinitialize device priorities if device count changed
@@ -596,17 +717,9 @@ def start_simulation():
             
             current_devices = len(simulation_state.get('device_priorities', {}))
             if current_devices != num_devices:
-                simulation_state['device_priorities'] = {}
-                for i in range(1, num_devices + 1):
-                    device_id = f'device_{i}'
-                    if i <= num_devices * 0.3:
-                        simulation_state['device_priorities'][device_id] = 'HIGH'
-                    elif i <= num_devices * 0.7:
-                        simulation_state['device_priorities'][device_id] = 'MODERATE'
-                    else:
-                        simulation_state['device_priorities'][device_id] = 'LOW'
+                simulation_state['device_priorities'] = default_device_priorities(num_devices)
         
-        thread = threading.Thread(target=run_simulation_background, args=(duration,))
+        thread = threading.Thread(target=run_simulation_background, args=(duration, num_fog_nodes))
         thread.daemon = True
         thread.start()
         
@@ -635,11 +748,10 @@ def stop_simulation():
 def get_events():
     """Get simulation events (for real-time updates)."""
     events = []
-    while not event_queue.empty():
+    while event_queue:
         try:
-            event = event_queue.get_nowait()
-            events.append(event)
-        except queue.Empty:
+            events.append(event_queue.popleft())
+        except IndexError:
             break
     
     return jsonify({'events': events})
@@ -652,7 +764,7 @@ def get_tasks():
     with state_lock:
         # Get pending fog tasks (without popping)
         fog_tasks = [task for _, task in simulation_state['pending_fog_tasks']]
-        cloud_tasks = simulation_state['cloud_tasks'].copy()
+        cloud_tasks = list(simulation_state['cloud_tasks'])
         active_tasks = list(simulation_state['active_tasks'].values())
     
     return jsonify({
@@ -667,9 +779,15 @@ def get_analytics():
     global simulation_state
     
     try:
+        # Read the metrics once and reuse them for every derived value below
+        metrics = simulation_state['metrics']
+        total_tasks = metrics['tasks_generated']
+        processed_tasks = metrics['tasks_processed']
+        offload_rate = metrics['offloading_rate']
+        
         success_rate = 95.0
-        if simulation_state['metrics']['tasks_generated'] > 0:
-            success_rate = min(100, (simulation_state['metrics']['tasks_processed'] / simulation_state['metrics']['tasks_generated']) * 100)
+        if total_tasks > 0:
+            success_rate = min(100, (processed_tasks / total_tasks) * 100)
         
         latency_history = simulation_state.get('latency_history', {})
         
@@ -678,19 +796,18 @@ def get_analytics():
             cloud_data = latency_history['cloud_latency']
             timestamps = latency_history['timestamps']
             
-            while len(fog_data) < 6:
-                fog_data.append(fog_data[-1] if fog_data else 45)
-                cloud_data.append(cloud_data[-1] if cloud_data else 130)
-                timestamps.append(f"{len(timestamps)*20}s")
+            # Pad copies up to 6 points in one step; the shared history that
+            # the simulation thread appends to is never modified here
+            pad = 6 - len(fog_data)
+            if pad > 0:
+                fog_data = fog_data + [fog_data[-1]] * pad
+                cloud_data = cloud_data + [cloud_data[-1] if cloud_data else 130] * pad
+                timestamps = timestamps + [f"{i*20}s" for i in range(len(timestamps), len(timestamps) + pad)]
         else:
             fog_data = [45, 52, 48, 55, 50, 47]
             cloud_data = [120, 125, 130, 128, 132, 129]
             timestamps = ['0s', '20s', '40s', '60s', '80s', '100s']
         
-        offload_rate = simulation_state['metrics']['offloading_rate']
-        total_tasks = simulation_state['metrics']['tasks_generated']
-        processed_tasks = simulation_state['metrics']['tasks_processed']
-        
         if total_tasks > 0:
             fog_processing = max(20, int((processed_tasks * (100 - offload_rate)) / 100))
             cloud_processing = max(10, int((processed_tasks * offload_rate) / 100))
@@ -711,49 +828,27 @@ def get_analytics():
         else:
             num_fog_nodes = 3
         
-        total_tasks = simulation_state['metrics']['tasks_generated']
-        processed_tasks = simulation_state['metrics']['tasks_processed']
         base_utilization = 30 + min(40, (total_tasks * 0.5))
         
-        fog_utilization = []
-        for i in range(num_fog_nodes):
-            node_base = base_utilization + random.randint(-15, 15)
-            node_util = max(20, min(95, node_base))
-            fog_utilization.append(int(node_util))
+        # Draw every node's jitter in one call instead of one randint per node
+        jitters = random.choices(range(-15, 16), k=num_fog_nodes)
+        fog_utilization = [int(max(20, min(95, base_utilization + jitter))) for jitter in jitters]
         
         cloud_utilization = int(25 + min(30, (total_tasks * 0.3)) + random.randint(-5, 10))
         cloud_utilization = max(15, min(70, cloud_utilization))
         
+        # Per-node failure counts recorded by the simulation loop
         failure_events = {}
-        base_failures = simulation_state['metrics']['failure_events']
-        
-        if base_failures > 0:
-            failure_distribution = [0] * num_fog_nodes
-            # Generate weights dynamically to match number of fog nodes
-            # Use a pattern that varies weights slightly for each node
-            base_weights = [1.0, 1.2, 0.8, 1.1, 0.9, 1.0, 1.1, 0.9, 1.2, 1.0]  # Extended base weights
-            weights = [base_weights[i % len(base_weights)] for i in range(num_fog_nodes)]
-            
-            for _ in range(base_failures):
-                node_index = random.choices(range(num_fog_nodes), weights=weights)[0]
-                failure_distribution[node_index] += 1
-            
-            for i in range(num_fog_nodes):
-                node_id = f'node_{i+1}'
-                failure_events[node_id] = failure_distribution[i]
-        else:
-            for i in range(num_fog_nodes):
-                node_id = f'node_{i+1}'
-                failure_events[node_id] = 0
+        node_failures = simulation_state.get('node_failures', [])
+        for i in range(num_fog_nodes):
+            node_id = f'node_{i+1}'
+            failure_events[node_id] = node_failures[i] if i < len(node_failures) else 0
         
         # Get queue lengths (including active tasks)
         with state_lock:
             fog_pending = len(simulation_state['pending_fog_tasks'])
             cloud_pending = len(simulation_state['cloud_tasks'])
-            active_fog = sum(1 for task in simulation_state['active_tasks'].values() 
-                            if task.get('node_assigned') == 'fog')
-            active_cloud = sum(1 for task in simulation_state['active_tasks'].values() 
-                              if task.get('node_assigned') == 'cloud')
+            active_fog, active_cloud = count_active_tasks()
             fog_queue_length = fog_pending + active_fog
             cloud_queue_length = cloud_pending + active_cloud
             priority_dist = simulation_state['priority_distribution'].copy()
@@ -775,7 +870,7 @@ def get_analytics():
             },
             'failure_events': failure_events,
             'performance_summary': {
-                'avg_response_time': f"{simulation_state['metrics']['avg_latency']:.1f}ms",
+                'avg_response_time': f"{metrics['avg_latency']:.1f}ms",
                 'success_rate': f"{success_rate:.1f}%",
                 'offloading_rate': f"{offload_rate:.1f}%",
                 'energy_efficiency': f"{85 + random.randint(-5, 10):.1f}%"
@@ -817,6 +912,20 @@ def get_analytics():
             'error': str(e)
         }), 200  # Return 200 with default data instead of 500
 
+@lru_cache(maxsize=32)
+def fog_node_layout(num_fog_nodes):
+    """
+    Static id and position of each fog node in the topology view.
+    Cached per node count so ids and coordinates are only built once.
+    
+    Returns:
+        tuple: (node_id, x, y) for each fog node
+    """
+    return tuple(
+        (f'FOG_{i+1:03d}', 20 + (i * 30) % 80, 20 + (i * 25) % 60)
+        for i in range(num_fog_nodes)
+    )
+
 @app.route('/api/network/topology')
 def get_network_topology():
     """Get network topology visualization data."""
@@ -826,20 +935,19 @@ def get_network_topology():
     
     with state_lock:
         fog_pending = len(simulation_state['pending_fog_tasks'])
-        active_fog = sum(1 for task in simulation_state['active_tasks'].values() 
-                        if task.get('node_assigned') == 'fog')
+        active_fog, _ = count_active_tasks()
         fog_queue_length = fog_pending + active_fog
         # Distribute tasks evenly across fog nodes (dummy distribution)
         tasks_per_node = fog_queue_length // num_fog_nodes if num_fog_nodes > 0 else 0
         remainder = fog_queue_length % num_fog_nodes
     
     fog_nodes = []
-    for i in range(num_fog_nodes):
+    for i, (node_id, x, y) in enumerate(fog_node_layout(num_fog_nodes)):
         node_tasks = tasks_per_node + (1 if i < remainder else 0)
         fog_nodes.append({
-            'id': f'FOG_{i+1:03d}',
-            'x': 20 + (i * 30) % 80,
-            'y': 20 + (i * 25) % 60,
+            'id': node_id,
+            'x': x,
+            'y': y,
             'status': 'operational',
             'queued_tasks': node_tasks
         })
@@ -852,93 +960,161 @@ def get_network_topology():
             'status': 'operational'
         },
         'fog_nodes': fog_nodes,
-        'iot_devices': [
-            {'id': 'IOT_001', 'x': 10, 'y': 10, 'connected_to': 'FOG_001'},
-            {'id': 'IOT_002', 'x': 30, 'y': 15, 'connected_to': 'FOG_001'},
-            {'id': 'IOT_003', 'x': 70, 'y': 15, 'connected_to': 'FOG_002'},
-            {'id': 'IOT_004', 'x': 90, 'y': 25, 'connected_to': 'FOG_002'},
-            {'id': 'IOT_005', 'x': 40, 'y': 70, 'connected_to': 'FOG_003'},
-            {'id': 'IOT_006', 'x': 60, 'y': 90, 'connected_to': 'FOG_003'}
-        ]
+        'iot_devices': TOPOLOGY_IOT_DEVICES
     })
 
+# Internal bookkeeping kept in simulation_state that is not part of the export
+EXPORT_EXCLUDED_KEYS = ('active_counts', 'active_deadlines', 'node_failures')
+
+def _dump_json(value):
+    """Serialise one value as compact JSON."""
+    return json.dumps(value, separators=(',', ':'))
+
+def _stream_json_list(items):
+    """Yield a JSON array one item at a time."""
+    yield '['
+    for i, item in enumerate(items):
+        yield (',' if i else '') + _dump_json(item)
+    yield ']'
+
 @app.route('/api/export/data')
 def export_simulation_data():
-    """Export simulation data for analysis."""
+    """Export simulation data for analysis, streamed as JSON."""
     global simulation_state
     
     with state_lock:
-        fog_tasks = [task for _, task in simulation_state['pending_fog_tasks']]
-        cloud_tasks = simulation_state['cloud_tasks'].copy()
+        # Copy only what the simulation thread mutates in place (task dicts and
+        # latency history); everything else is a cheap one-level snapshot
+        pending_fog = [(sort_key, dict(task))
+                       for sort_key, task in simulation_state['pending_fog_tasks']]
+        cloud_tasks = [dict(task) for task in simulation_state['cloud_tasks']]
+        active_tasks = {task_id: dict(task)
+                        for task_id, task in simulation_state['active_tasks'].items()}
+        simulation_data = {}
+        for key, value in simulation_state.items():
+            if key in EXPORT_EXCLUDED_KEYS or key in ('pending_fog_tasks', 'cloud_tasks', 'active_tasks'):
+                continue
+            if key == 'latency_history':
+                value = {name: list(series) for name, series in value.items()}
+            elif isinstance(value, dict):
+                value = value.copy()
+            elif isinstance(value, (list, deque)):
+                value = list(value)
+            simulation_data[key] = value
     
-    return jsonify({
-        'simulation_data': simulation_state,
-        'export_timestamp': datetime.now().isoformat(),
-        'config': {
-            'duration': simulation_state['duration'],
-            'fog_nodes': simulation_state.get('config', {}).get('network', {}).get('fog_nodes', 3),
-            'iot_devices': simulation_state.get('config', {}).get('network', {}).get('iot_devices', 10)
-        },
-        'task_queues': {
-            'fog_queue': fog_tasks,
-            'cloud_queue': cloud_tasks
-        }
-    })
+    fog_tasks = [task for _, task in pending_fog]
+    network_config = (simulation_data.get('config') or {}).get('network', {})
+    export_config = {
+        'duration': simulation_data['duration'],
+        'fog_nodes': network_config.get('fog_nodes', 3),
+        'iot_devices': network_config.get('iot_devices', 10)
+    }
+    export_timestamp = datetime.now().isoformat()
+    
+    def generate():
+        # One compact chunk per top-level key, and per task in the task lists
+        yield '{"simulation_data":{'
+        for key, value in simulation_data.items():
+            yield _dump_json(key) + ':' + _dump_json(value) + ','
+        yield '"pending_fog_tasks":'
+        yield from _stream_json_list(pending_fog)
+        yield ',"cloud_tasks":'
+        yield from _stream_json_list(cloud_tasks)
+        yield ',"active_tasks":{'
+        for i, (task_id, task) in enumerate(active_tasks.items()):
+            yield (',' if i else '') + _dump_json(str(task_id)) + ':' + _dump_json(task)
+        yield '}},"export_timestamp":' + _dump_json(export_timestamp)
+        yield ',"config":' + _dump_json(export_config)
+        yield ',"task_queues":{"fog_queue":'
+        yield from _stream_json_list(fog_tasks)
+        yield ',"cloud_queue":'
+        yield from _stream_json_list(cloud_tasks)
+        yield '}}'
+    
+    return Response(generate(), mimetype='application/json')
 
-def run_simulation_background(duration):
+def run_simulation_background(duration, num_fog_nodes):
     """Run simulation in background thread with priority-based scheduling."""
-    global simulation_state, event_queue
+    global simulation_state
     
     try:
-        event_queue.put({
-            'type': 'info',
-            'message': 'Simulation environment initialized with priority-based scheduling',
-            'timestamp': datetime.now().isoformat()
-        })
+        push_event('info', 'Simulation environment initialized with priority-based scheduling')
         
         start_time = time.time()
         end_time = start_time + duration
         last_task_gen_time = start_time
         task_gen_interval = 0.5  # Generate task every 0.5 seconds
         
-        fog_latencies = []
-        cloud_latencies = []
+        # Rolling windows of the most recent latencies (older values are never read)
+        fog_latencies = deque(maxlen=LATENCY_WINDOW)
+        cloud_latencies = deque(maxlen=LATENCY_WINDOW)
+        cloud_routed = 0
+
+        # Read the configuration once per run instead of on every task/tick
+        config = simulation_state.get('config', {})
+        num_devices = config.get('network', {}).get('iot_devices', 10)
+        complexity_range = config.get('tasks', {}).get('complexity_range', [50, 2000])
+        device_ids = tuple(f'device_{i}' for i in range(1, num_devices + 1))
+        failure_prob = config.get('simulation', {}).get('failure_probability', 0.1)
+        # Metrics-only runs can set simulation.log_task_events to false to skip
+        # the per-task event messages (metrics and queues are unaffected)
+        log_task_events = config.get('simulation', {}).get('log_task_events', True) is not False
         
-        while time.time() < end_time and simulation_state['running']:
+        # Failure simulation: failures arrive per node as a Poisson process with
+        # the same mean rate as one `failure_prob` roll every FAILURE_CHECK_INTERVAL.
+        # Only each node's next failure is kept, redrawn as it fires. The
+        # probability is clamped to [0, 1] so, like the old per-check roll, a
+        # node fails at most once per interval on average
+        failure_prob = min(max(failure_prob, 0.0), 1.0)
+        failure_rate = failure_prob / FAILURE_CHECK_INTERVAL
+        failure_heap = build_failure_heap(num_fog_nodes, failure_rate)
+        next_progress_report = 0.0
+
+        while simulation_state['running']:
+            # Read the clock once per tick; every check below reuses it
             current_time = time.time()
+            if current_time >= end_time:
+                break
             elapsed = current_time - start_time
             progress = (elapsed / duration) * 100
             simulation_state['progress'] = min(progress, 100)
             
             # Generate tasks periodically
             if current_time - last_task_gen_time >= task_gen_interval:
-                task = generate_task(elapsed)
-                
-                with state_lock:
-                    simulation_state['metrics']['tasks_generated'] += 1
+                task = generate_task(elapsed, device_ids, complexity_range)
                 
                 # Route task based on priority
                 if task['priority'] == 'HIGH':
-                    schedule_fog_task(task)
+                    schedule_fog_task(task, log_task_events)
                 else:
-                    schedule_cloud_task(task)
+                    schedule_cloud_task(task, log_task_events)
+                    cloud_routed += 1
+                
+                # Offloading rate (percentage of tasks sent to cloud) only changes
+                # when a task is routed, so it is maintained here incrementally
+                with state_lock:
+                    simulation_state['metrics']['tasks_generated'] += 1
+                    total_generated = simulation_state['metrics']['tasks_generated']
+                    simulation_state['metrics']['offloading_rate'] = (cloud_routed / total_generated) * 100
                 
                 last_task_gen_time = current_time
+            
+            # Clean up completed active tasks (tasks that have finished processing)
+            # Tasks stay in active_tasks for a short time to show they're being processed
+            # Only expired deadlines are popped from the heap, no scan over all active tasks
+            with state_lock:
+                active_deadlines = simulation_state['active_deadlines']
+                while active_deadlines and active_deadlines[0][0] < current_time:
+                    _, task_id = heapq.heappop(active_deadlines)
+                    finished_task = simulation_state['active_tasks'].pop(task_id, None)
+                    if finished_task:
+                        simulation_state['active_counts'][finished_task['node_assigned']] -= 1
                 
-                # Log which device generated the task
-                event_queue.put({
-                    'type': 'info',
-                    'message': f"Task {task['task_id']} generated by {task.get('device_id', 'unknown')} with {task['priority']} priority",
-                    'timestamp': datetime.now().isoformat()
-                })
+                # Running per-tier counts, adjusted above as tasks finish
+                active_fog_count, active_cloud_count = count_active_tasks()
             
             # Process fog tasks (HIGH priority) - only process if no active fog tasks
             # This limits concurrent processing and allows queue to build up
-            with state_lock:
-                active_fog_count = sum(1 for task in simulation_state['active_tasks'].values() 
-                                      if task.get('node_assigned') == 'fog')
-            
-            # Only process new fog task if there are no active fog tasks (limit concurrency)
             if simulation_state['pending_fog_tasks'] and active_fog_count == 0:
                 fog_latency = process_fog_task(elapsed)
                 if fog_latency:
@@ -946,27 +1122,7 @@ def run_simulation_background(duration):
                     with state_lock:
                         simulation_state['metrics']['tasks_processed'] += 1
             
-            # Clean up completed active tasks (tasks that have finished processing)
-            # Tasks stay in active_tasks for a short time to show they're being processed
-            with state_lock:
-                current_time_check = time.time()
-                completed_tasks = []
-                for task_id, task in simulation_state['active_tasks'].items():
-                    processing_start = task.get('processing_start', 0)
-                    processing_time = task.get('processing_time', 0.2)  # Default 200ms (fog) or 500ms (cloud)
-                    # Remove task if it's been processing for longer than its processing time
-                    if current_time_check - processing_start > processing_time:
-                        completed_tasks.append(task_id)
-                
-                for task_id in completed_tasks:
-                    del simulation_state['active_tasks'][task_id]
-            
-            # Process cloud tasks (LOW/MODERATE priority) - limit concurrent processing
-            with state_lock:
-                active_cloud_count = sum(1 for task in simulation_state['active_tasks'].values() 
-                                        if task.get('node_assigned') == 'cloud')
-            
-            # Only process new cloud task if there are no active cloud tasks (limit concurrency)
+            # Process cloud tasks (LOW/MODERATE priority) - only process if no active cloud tasks
             if simulation_state['cloud_tasks'] and active_cloud_count == 0:
                 cloud_latency = process_cloud_task(elapsed)
                 if cloud_latency:
@@ -976,30 +1132,34 @@ def run_simulation_background(duration):
             
             # Update latency history periodically (every 3 seconds of simulation time)
             if int(elapsed) % 3 == 0 and elapsed > 0:
-                avg_fog = sum(fog_latencies[-10:]) / len(fog_latencies[-10:]) if fog_latencies else 45
-                avg_cloud = sum(cloud_latencies[-10:]) / len(cloud_latencies[-10:]) if cloud_latencies else 130
+                avg_fog = fmean(fog_latencies) if fog_latencies else 45
+                avg_cloud = fmean(cloud_latencies) if cloud_latencies else 130
                 
                 with state_lock:
                     # Always update latency history to show progression
                     if len(fog_latencies) > 0 or len(cloud_latencies) > 0:
+                        history_fog = simulation_state['latency_history']['fog_latency']
+                        history_cloud = simulation_state['latency_history']['cloud_latency']
+                        history_timestamps = simulation_state['latency_history']['timestamps']
+                        
                         # Only append if timestamp is different (avoid duplicates)
-                        last_timestamp = simulation_state['latency_history']['timestamps'][-1] if simulation_state['latency_history']['timestamps'] else None
+                        last_timestamp = history_timestamps[-1] if history_timestamps else None
                         current_timestamp = f"{elapsed:.0f}s"
                         if last_timestamp != current_timestamp:
-                            simulation_state['latency_history']['fog_latency'].append(avg_fog)
-                            simulation_state['latency_history']['cloud_latency'].append(avg_cloud)
-                            simulation_state['latency_history']['timestamps'].append(current_timestamp)
+                            history_fog.append(avg_fog)
+                            history_cloud.append(avg_cloud)
+                            history_timestamps.append(current_timestamp)
                             
-                            # Keep only last 6 data points
-                            if len(simulation_state['latency_history']['fog_latency']) > 6:
-                                simulation_state['latency_history']['fog_latency'] = simulation_state['latency_history']['fog_latency'][-6:]
-                                simulation_state['latency_history']['cloud_latency'] = simulation_state['latency_history']['cloud_latency'][-6:]
-                                simulation_state['latency_history']['timestamps'] = simulation_state['latency_history']['timestamps'][-6:]
+                            # Keep only last 6 data points (trimmed in place)
+                            if len(history_fog) > 6:
+                                del history_fog[:-6]
+                                del history_cloud[:-6]
+                                del history_timestamps[:-6]
                         else:
                             # Update last values if timestamp is same
-                            if len(simulation_state['latency_history']['fog_latency']) > 0:
-                                simulation_state['latency_history']['fog_latency'][-1] = avg_fog
-                                simulation_state['latency_history']['cloud_latency'][-1] = avg_cloud
+                            if len(history_fog) > 0:
+                                history_fog[-1] = avg_fog
+                                history_cloud[-1] = avg_cloud
                     
                     # Update average latency continuously
                     if fog_latencies and cloud_latencies:
@@ -1008,64 +1168,41 @@ def run_simulation_background(duration):
                         simulation_state['metrics']['avg_latency'] = avg_fog
                     elif cloud_latencies:
                         simulation_state['metrics']['avg_latency'] = avg_cloud
-                    
-                    # Update offloading rate (percentage of tasks sent to cloud)
-                    total_generated = simulation_state['metrics']['tasks_generated']
-                    if total_generated > 0:
-                        cloud_count = simulation_state['priority_distribution'].get('LOW', 0) + simulation_state['priority_distribution'].get('MODERATE', 0)
-                        simulation_state['metrics']['offloading_rate'] = (cloud_count / total_generated) * 100
             
-            # Calculate offloading rate (percentage of tasks going to cloud)
-            with state_lock:
-                total_generated = simulation_state['metrics']['tasks_generated']
-                if total_generated > 0:
-                    cloud_count = simulation_state['priority_distribution'].get('LOW', 0) + simulation_state['priority_distribution'].get('MODERATE', 0)
-                    simulation_state['metrics']['offloading_rate'] = (cloud_count / total_generated) * 100
-            
-            # Failure simulation (unchanged)
-            failure_prob = simulation_state.get('config', {}).get('simulation', {}).get('failure_probability', 0.1)
-            num_fog_nodes = simulation_state.get('config', {}).get('network', {}).get('fog_nodes', 3)
-            
-            if int(elapsed * 10) % 20 == 0:
-                for node_id in range(1, num_fog_nodes + 1):
-                    if random.random() < failure_prob:
-                        simulation_state['metrics']['failure_events'] += 1
-                        event_queue.put({
-                            'type': 'warning',
-                            'message': f'Fog Node {node_id} failure detected',
-                            'timestamp': datetime.now().isoformat()
-                        })
+            # Failure simulation - emit every scheduled failure that is now due,
+            # with all of this tick's failures pushed as one batch of events
+            failure_messages = []
+            while failure_heap and failure_heap[0][0] <= elapsed:
+                failure_time, node_id = failure_heap[0]
+                heapq.heapreplace(failure_heap,
+                                  (failure_time + random.expovariate(failure_rate), node_id))
+                with state_lock:
+                    simulation_state['metrics']['failure_events'] += 1
+                    simulation_state['node_failures'][node_id - 1] += 1
+                failure_messages.append(f'Fog Node {node_id} failure detected')
+            if failure_messages:
+                push_events('warning', failure_messages)
             
-            # Periodic status updates
-            if elapsed % 3 < 0.1:
+            # Periodic status updates on a fixed schedule; a modulo check on
+            # elapsed time could skip or repeat reports depending on tick timing
+            if elapsed >= next_progress_report:
+                next_progress_report = elapsed + PROGRESS_REPORT_INTERVAL
                 with state_lock:
                     fog_q_len = len(simulation_state['pending_fog_tasks'])
                     cloud_q_len = len(simulation_state['cloud_tasks'])
                 
-                event_queue.put({
-                    'type': 'info',
-                    'message': f'📊 Progress: {simulation_state["progress"]:.1f}% - Tasks: {simulation_state["metrics"]["tasks_processed"]}/{simulation_state["metrics"]["tasks_generated"]} | Fog Queue: {fog_q_len} | Cloud Queue: {cloud_q_len}',
-                    'timestamp': datetime.now().isoformat()
-                })
+                push_event('info', f'📊 Progress: {simulation_state["progress"]:.1f}% - Tasks: {simulation_state["metrics"]["tasks_processed"]}/{simulation_state["metrics"]["tasks_generated"]} | Fog Queue: {fog_q_len} | Cloud Queue: {cloud_q_len}')
             
             time.sleep(0.1)
         
         simulation_state['running'] = False
         simulation_state['progress'] = 100
         
-        event_queue.put({
-            'type': 'success',
-            'message': 'Simulation completed successfully',
-            'timestamp': datetime.now().isoformat()
-        })
+        push_event('success', 'Simulation completed successfully')
         
     except Exception as e:
         simulation_state['running'] = False
-        event_queue.put({
-            'type': 'error',
-            'message': f'Simulation error: {str(e)}',
-            'timestamp': datetime.now().isoformat()
-        })
+        push_event('error', f'Simulation error: {str(e)}')
 
 @app.errorhandler(404)
 def not_found(error):
@@ -1077,29 +1214,31 @@ def internal_error(error):
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    print("🌐 Starting Fog Computing Simulator Backend API")
-    print("=" * 60)
-    print(f"📡 API Server: http://0.0.0.0:{port}")
-    if os.environ.get('RENDER'):
-        print("🚀 Running on Render (Production)")
-    else:
-        print("🔧 Running in Development Mode")
-    print(f"🔗 CORS enabled for: {', '.join(allowed_origins)}")
-    print("\n💡 API Endpoints:")
-    print("   • GET  /api/status")
-    print("   • GET  /api/config")
-    print("   • POST /api/config")
-    print("   • POST /api/simulation/start")
-    print("   • POST /api/simulation/stop")
-    print("   • GET  /api/simulation/events")
-    print("   • GET  /api/tasks")
-    print("   • GET  /api/analytics/metrics")
-    print("\n🎯 Priority-Based Scheduling:")
-    print("   • HIGH priority → Fog processing")
-    print("   • LOW/MODERATE → Cloud processing")
-    print("   • Fog queue: Priority sorted by (priority, arrival_time, complexity)")
-    print("\n🛑 Press Ctrl+C to stop the server")
-    print("=" * 60)
+    mode_line = "🚀 Running on Render (Production)" if os.environ.get('RENDER') else "🔧 Running in Development Mode"
+    banner = [
+        "🌐 Starting Fog Computing Simulator Backend API",
+        "=" * 60,
+        f"📡 API Server: http://0.0.0.0:{port}",
+        mode_line,
+        f"🔗 CORS enabled for: {', '.join(allowed_origins)}",
+        "\n💡 API Endpoints:",
+        "   • GET  /api/status",
+        "   • GET  /api/config",
+        "   • POST /api/config",
+        "   • POST /api/simulation/start",
+        "   • POST /api/simulation/stop",
+        "   • GET  /api/simulation/events",
+        "   • GET  /api/tasks",
+        "   • GET  /api/analytics/metrics",
+        "\n🎯 Priority-Based Scheduling:",
+        "   • HIGH priority → Fog processing",
+        "   • LOW/MODERATE → Cloud processing",
+        "   • Fog queue: Priority sorted by (priority, arrival_time, complexity)",
+        "\n🛑 Press Ctrl+C to stop the server",
+        "=" * 60
+    ]
+    # Emit the whole banner in one write
+    print("\n".join(banner))
     
     # Get port from environment variable (Render provides this) or use default 5000
     port = int(os.environ.get('PORT', 5000))